@@ -2,9 +2,12 @@
 Minimal usage example for the GoP probabilistic curvature implementation.
 """
 
+import numpy as np
+
 from gop_curvature import (
     gamma_bell_curve,
     compute_tmunu_prob,
+    compute_tmunu_prob_batch,
     KAPPA_A,
     E0,
 )
@@ -29,6 +32,14 @@ def main() -> None:
     print(T_prob)
     print()
     print("Energy density contribution T00 =", T_prob[0, 0], "erg/cm^3")
+    print()
+
+    # Many parameter sets at once (e.g. one entry per spaxel)
+    E_batch = E0 * np.logspace(-1, 1, 5)
+    rho_b_batch = np.full_like(E_batch, rho_b)
+    T_batch = compute_tmunu_prob_batch(E_batch, rho_b_batch, z=z)
+    print("Batched T_prob shape =", T_batch.shape)
+    print("Batched T00 =", T_batch[:, 0, 0], "erg/cm^3")
 
 
 if __name__ == "__main__":
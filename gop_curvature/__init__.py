@@ -15,6 +15,7 @@ from .bell_curve_decoherence_kernel import gamma_bell_curve
 from .probabilistic_stress_energy import (
     rho_psi_effective,
     compute_tmunu_prob,
+    compute_tmunu_prob_batch,
 )
 
 
@@ -0,0 +1,37 @@
+// CUDA kernels for GoP hot paths, compiled at runtime through cupy.RawModule
+// (see gop_kernels.py). GPU twins of the numba kernels in gop_kernels_numba.py.
+//
+// rho_eff_kernel[_f]: fused normalized-mode
+//     rho_eff = rho_b + kappaA * f_ent * (1 + a_cp) * scale * rho_b
+//                       * exp(1 - rho_b * scale / E0)
+// with E_local = scale * rho_b, one thread per element, no intermediates.
+
+extern "C" __global__
+void rho_eff_kernel(const double* rho_b, double* out,
+                    double E0, double kappaA, double fent, double acp,
+                    double scale, long long n)
+{
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) {
+        return;
+    }
+    const double x_per_rho = scale / E0;  // E_local / E0 per unit rho_b
+    const double pref = kappaA * fent * (1.0 + acp) * scale;
+    const double rb = rho_b[i];
+    out[i] = rb + pref * rb * exp(1.0 - rb * x_per_rho);
+}
+
+extern "C" __global__
+void rho_eff_kernel_f(const float* rho_b, float* out,
+                      float E0, float kappaA, float fent, float acp,
+                      float scale, long long n)
+{
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) {
+        return;
+    }
+    const float x_per_rho = scale / E0;
+    const float pref = kappaA * fent * (1.0f + acp) * scale;
+    const float rb = rho_b[i];
+    out[i] = rb + pref * rb * expf(1.0f - rb * x_per_rho);
+}
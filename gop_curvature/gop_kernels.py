@@ -0,0 +1,94 @@
+"""
+Compiled kernels for GoP hot paths: numba (CPU) and CuPy/CUDA (GPU).
+
+numba and cupy are optional dependencies. When one is not installed, the
+kernel names that depend on it are bound to None and callers fall back to
+their NumPy paths.
+
+The numba kernels live in gop_kernels_numba, which is imported on the first
+kernel call rather than here: importing numba takes several hundred
+milliseconds, which every `import gop_curvature` would otherwise pay. They
+are compiled on first call and cached on disk (cache=True), so later
+processes reuse the machine code instead of recompiling. The CUDA sources
+live in gop_kernels.cu and are compiled by CuPy on first use.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import cupy
+except ImportError:  # optional GPU backend
+    cupy = None
+
+
+def get_array_module(*arrays):
+    """
+    Return the array namespace for the inputs: cupy for CuPy arrays,
+    numpy otherwise (always numpy when cupy is not installed).
+    """
+    if cupy is not None:
+        return cupy.get_array_module(*arrays)
+    return np
+
+
+if importlib.util.find_spec("numba") is not None:
+
+    def rho_eff_fused(rho_b, E0, kappaA, fent, acp, scale, out):
+        """numba fused normalized-mode rho_eff (see gop_kernels_numba)."""
+        from . import gop_kernels_numba
+
+        return gop_kernels_numba.rho_eff_fused(rho_b, E0, kappaA, fent, acp, scale, out)
+
+    def slope_streaming(r, rho, r_max):
+        """numba one-pass log-log slope (see gop_kernels_numba)."""
+        from . import gop_kernels_numba
+
+        return gop_kernels_numba.slope_streaming(r, rho, r_max)
+
+else:
+    rho_eff_fused = None
+    slope_streaming = None
+
+
+if cupy is not None:
+    _CUDA_SOURCE = Path(__file__).with_name("gop_kernels.cu")
+    _THREADS_PER_BLOCK = 256
+
+    # Γ(E) = κA * E * exp(1 - E/E0) as a single elementwise GPU kernel
+    gamma_cuda = cupy.ElementwiseKernel(
+        "T E, T kappaA, T E0",
+        "T Gamma",
+        "Gamma = kappaA * E * exp(1 - E / E0)",
+        "gop_gamma_bell_curve",
+    )
+
+    @functools.lru_cache(maxsize=None)
+    def _cuda_module():
+        return cupy.RawModule(code=_CUDA_SOURCE.read_text())
+
+    def rho_eff_cuda(rho_b, E0, kappaA, fent, acp, scale, out):
+        """
+        GPU twin of rho_eff_fused: launches rho_eff_kernel from gop_kernels.cu
+        over contiguous 1-D float32/float64 CuPy arrays rho_b and out.
+        """
+        if rho_b.dtype == cupy.float32:
+            name, ftype = "rho_eff_kernel_f", np.float32
+        else:
+            name, ftype = "rho_eff_kernel", np.float64
+        kernel = _cuda_module().get_function(name)
+        n = rho_b.size
+        blocks = (n + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+        # float() first: scale may arrive as a 0-d device array
+        scalars = [ftype(float(v)) for v in (E0, kappaA, fent, acp, scale)]
+        kernel((blocks,), (_THREADS_PER_BLOCK,), (rho_b, out, *scalars, np.int64(n)))
+        return out
+
+else:
+    gamma_cuda = None
+    rho_eff_cuda = None
@@ -0,0 +1,62 @@
+"""
+numba kernels behind gop_kernels.rho_eff_fused and gop_kernels.slope_streaming.
+
+gop_kernels imports this module on the first kernel call, so importing
+gop_curvature does not import numba.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numba
+
+
+@numba.njit(fastmath=True, cache=True)
+def rho_eff_fused(rho_b, E0, kappaA, fent, acp, scale, out):
+    """
+    Fused normalized-mode rho_eff = rho_b + Γ(E_local) * f_ent * (1 + A_CP).
+
+    With E_local = scale * rho_b (scale = E0 / rho_ref), this evaluates
+
+        rho_b + kappaA * f_ent * (1 + a_cp) * scale * rho_b
+              * exp(1 - rho_b * scale / E0)
+
+    in a single pass over a contiguous 1-D rho_b, writing into the
+    preallocated 1-D out (same size and dtype), with no intermediates.
+    Serial: it targets short profiles, where a parallel launch costs more
+    than the loop itself.
+    """
+    # Scalars are cast to rho_b's dtype so float32 input stays float32
+    ftype = rho_b.dtype.type
+    x_per_rho = ftype(scale / E0)  # E_local / E0 per unit rho_b
+    pref = ftype(kappaA * fent * (1.0 + acp) * scale)
+    one = ftype(1.0)
+    for i in range(rho_b.size):
+        rb = rho_b[i]
+        out[i] = rb + pref * rb * math.exp(one - rb * x_per_rho)
+    return out
+
+
+@numba.njit(cache=True)
+def slope_streaming(r, rho, r_max):
+    """
+    Least-squares slope of ln(rho) vs ln(r) over 0 < r <= r_max, rho > 0.
+
+    Accumulates the sums of logs in one pass over 1-D r and rho (no mask
+    or log temporaries). Returns NaN when fewer than 3 points qualify.
+    """
+    sx = sy = sxx = sxy = 0.0
+    n = 0
+    for i in range(r.size):
+        if 0.0 < r[i] <= r_max and rho[i] > 0.0:
+            lx = math.log(r[i])
+            ly = math.log(rho[i])
+            sx += lx
+            sy += ly
+            sxx += lx * lx
+            sxy += lx * ly
+            n += 1
+    if n < 3:
+        return math.nan
+    return (n * sxy - sx * sy) / (n * sxx - sx * sx)
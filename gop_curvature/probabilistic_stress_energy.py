@@ -4,6 +4,9 @@ Probabilistic stress-energy tensor T^{prob}_{mu nu} for the GoP framework.
 This module provides simple, usable functions that map:
     (E, rho_b, z) -> T_prob(mu,nu)
 
+either for a single parameter set (compute_tmunu_prob) or for N parameter
+sets at once, passed as 1-D arrays (compute_tmunu_prob_batch).
+
 under a set of phenomenological assumptions consistent with existing GoP work.
 
 IMPORTANT CONVENTION:
@@ -22,6 +25,11 @@ from .gop_constants import (
 from .bell_curve_decoherence_kernel import gamma_bell_curve
 
 
+# Metric signature (+, -, -, -) of the diagonal T^{prob}_{mu nu} template
+_ETA = np.diag([1.0, -1.0, -1.0, -1.0])
+_ETA.flags.writeable = False
+
+
 def rho_psi_effective(
     rho_b: float | np.ndarray,
     z: float = 0.0,
@@ -110,31 +118,62 @@ def compute_tmunu_prob(
 
         T00 = u_eff_prob
         Tii = - w * u_eff_prob   (for i = 1, 2, 3)
+
+    Evaluated as the N = 1 case of compute_tmunu_prob_batch.
     """
-    # Ensure numpy arrays for vectorized operations
-    E_arr = np.asarray(E, dtype=float)
-    rho_b_arr = np.asarray(rho_b, dtype=float)
+    # Single parameter set = the N = 1 case of the batched builder
+    E_arr = np.asarray(E, dtype=float).reshape(1)
+    rho_b_arr = np.asarray(rho_b, dtype=float).reshape(1)
+    return compute_tmunu_prob_batch(E_arr, rho_b_arr, z=z, f_ent=f_ent, eos_w=eos_w)[0]
 
-    # Canonical decoherence kernel Γ(E) (already includes κA)
-    Gamma = gamma_bell_curve(E_arr)
 
-    # Effective probabilistic density rho_Psi
-    rho_psi = rho_psi_effective(rho_b_arr, z=z, f_ent=f_ent)
+def compute_tmunu_prob_batch(
+    E: np.ndarray,
+    rho_b: np.ndarray,
+    z: float | np.ndarray = 0.0,
+    f_ent: float = F_ENT,
+    eos_w: float = 0.0,
+) -> np.ndarray:
+    """
+    Batched version of compute_tmunu_prob for N parameter sets.
 
-    # Effective probabilistic mass density (do NOT multiply by κA again)
-    rho_eff_prob = Gamma * rho_psi
+    Parameters
+    ----------
+    E : numpy.ndarray
+        1-D array (length N) of characteristic energy scales (erg or proxy).
+    rho_b : numpy.ndarray
+        1-D array (length N) of baryonic densities in g/cm^3 (or proxy).
+    z : float or numpy.ndarray, optional
+        Redshift, either shared by all entries or a length-N array.
+        Default is 0.0.
+    f_ent : float, optional
+        Entanglement fraction. Defaults to F_ENT.
+    eos_w : float, optional
+        Effective equation-of-state parameter w (p = w * u). Default is 0.
 
-    # Convert to energy density (erg/cm^3)
-    u_eff_prob = rho_eff_prob * (C_LIGHT ** 2)
+    Returns
+    -------
+    T_prob : numpy.ndarray
+        Array of shape (N, 4, 4); T_prob[n] equals
+        compute_tmunu_prob(E[n], rho_b[n], z[n], f_ent, eos_w).
 
-    # Build diagonal T^{prob}_{mu nu}
-    T = np.zeros((4, 4), dtype=float)
-    T[0, 0] = u_eff_prob
+    Notes
+    -----
+    Γ(E) and rho_Psi are evaluated once over the whole arrays, and the
+    stacked tensor is a single broadcast multiply of u_eff_prob[n] with the
+    template eta * diag(1, w, w, w) = diag(1, -w, -w, -w).
+    """
+    E_arr = np.asarray(E, dtype=float)
+    rho_b_arr = np.asarray(rho_b, dtype=float)
+    z_arr = np.asarray(z, dtype=float)
+    if E_arr.ndim != 1 or rho_b_arr.shape != E_arr.shape:
+        raise ValueError("E and rho_b must be 1-D arrays of the same length")
+    if z_arr.ndim != 0 and z_arr.shape != E_arr.shape:
+        raise ValueError("z must be a scalar or a 1-D array with the length of E")
 
-    # Isotropic pressures: p = w * u
-    p_eff = eos_w * u_eff_prob
-    T[1, 1] = -p_eff
-    T[2, 2] = -p_eff
-    T[3, 3] = -p_eff
+    Gamma = gamma_bell_curve(E_arr)
+    rho_psi = rho_psi_effective(rho_b_arr, z=z_arr, f_ent=f_ent)
+    u_eff_prob = Gamma * rho_psi * (C_LIGHT ** 2)
 
-    return T
+    metric_template = _ETA * np.array([1.0, eos_w, eos_w, eos_w])
+    return u_eff_prob[:, None, None] * metric_template
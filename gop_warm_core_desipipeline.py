@@ -38,6 +38,7 @@ or with options:
 from __future__ import annotations
 
 import argparse
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -47,6 +48,15 @@ import matplotlib.pyplot as plt
 # Canonical constants (single source of truth)
 from gop_curvature.gop_constants import KAPPA_A, E0, F_ENT, A_CP, C_LIGHT
 from gop_curvature.bell_curve_decoherence_kernel import gamma_bell_curve
+from gop_curvature.gop_kernels import (
+    get_array_module,
+    rho_eff_cuda,
+    rho_eff_fused,
+    slope_streaming,
+)
+
+# c^2 is loop-invariant; fold it once at import
+_C2 = C_LIGHT * C_LIGHT
 
 
 # -----------------------------
@@ -64,18 +74,66 @@ class GoPParams:
 # Baryonic profile (example: cored isothermal dwarf)
 # -----------------------------
 def rho_baryon(r_kpc: np.ndarray, rho0: float = 1.0, r_core_kpc: float = 0.5) -> np.ndarray:
-    return rho0 / (1.0 + (r_kpc / r_core_kpc) ** 2)
+    t = r_kpc * (1.0 / r_core_kpc)
+    return rho0 / (1.0 + t * t)
+
+
+# Default radial grid: log10(r/kpc) from -2 to 1.8 (0.01 → 63 kpc), 400 points
+_R_GRID_DEFAULT = (-2.0, 1.8, 400)
+
+
+@functools.lru_cache(maxsize=8)
+def _radial_grid(lo: float, hi: float, n: int) -> np.ndarray:
+    """Read-only logspace(lo, hi, n) radius grid, built once per (lo, hi, n)."""
+    r = np.logspace(lo, hi, n)
+    r.flags.writeable = False
+    return r
+
+
+@functools.lru_cache(maxsize=8)
+def _rho_baryon_on_grid(lo: float, hi: float, n: int, rho0: float, r_core_kpc: float) -> np.ndarray:
+    """Read-only rho_baryon on _radial_grid(lo, hi, n), cached per parameter set."""
+    rho_b = rho_baryon(_radial_grid(lo, hi, n), rho0=rho0, r_core_kpc=r_core_kpc)
+    rho_b.flags.writeable = False
+    return rho_b
 
 
 # -----------------------------
 # Energy proxy mapping
 # -----------------------------
+def _resolve_rho_ref(rho_b: np.ndarray, rho_ref: float | None) -> np.ndarray:
+    """
+    Reference density for normalized mode as a 0-d array in rho_b's dtype.
+
+    rho_ref defaults to rho_b[0], which requires a 1-D profile; an explicit
+    rho_ref must be a scalar. A zero reference is replaced by 1 branchlessly
+    (adding the rho_ref == 0 mask), so the value never leaves the array layer.
+    """
+    xp = get_array_module(rho_b)
+    # Reference density to make E_local(0) ~ E0 (activates kernel for template usage)
+    if rho_ref is None:
+        if rho_b.ndim != 1:
+            raise ValueError("normalized mode without rho_ref requires a 1-D rho_b profile")
+        rho_ref = rho_b[0, ...]  # 0-d view of the first element
+    rho_ref = xp.asarray(rho_ref, dtype=rho_b.dtype)
+    if rho_ref.ndim != 0:
+        raise ValueError("rho_ref must be a scalar")
+    # where() on a 0-d array costs several times more than this add
+    return rho_ref + (rho_ref == 0)
+
+
+def _normalized_scale(rho_b: np.ndarray, params: GoPParams, rho_ref: float | None) -> np.ndarray:
+    """E0 / rho_ref for normalized mode (0-d array), so that E_local = scale * rho_b."""
+    return params.E0_erg / _resolve_rho_ref(rho_b, rho_ref)
+
+
 def compute_E_local(
     rho_b: np.ndarray,
     params: GoPParams,
     mode: str = "normalized",
     rho_ref: float | None = None,
     Lcoh_cm: float = 1.0e18,
+    dtype=np.float64,
 ) -> np.ndarray:
     """
     Map a baryonic density profile rho_b to the kernel energy argument E_local.
@@ -83,15 +141,21 @@ def compute_E_local(
     Parameters
     ----------
     rho_b : np.ndarray
-        Baryonic density (toy or physical, depending on mode).
+        Baryonic density (toy or physical, depending on mode). A CuPy array
+        keeps the whole computation on the GPU.
     params : GoPParams
         Core-four parameters (E0 used in normalized mode).
     mode : str
         "normalized" or "physical".
     rho_ref : float or None
-        Reference density for normalized mode; if None, uses rho_b[0].
+        Reference density for normalized mode; if None, uses rho_b[0]
+        (rho_b must then be 1-D).
     Lcoh_cm : float
         Coherence length scale in cm for physical mode (V_coh = L^3).
+    dtype : numpy dtype
+        Floating-point type of the result. float32 is meant for normalized
+        (template) mode; physical mode requires float64, since c^2 * V_coh
+        alone overflows float32.
 
     Returns
     -------
@@ -99,19 +163,21 @@ def compute_E_local(
         Energy scale (erg or consistent proxy) passed into Γ(E).
     """
     mode = mode.lower().strip()
-    rho_b = np.asarray(rho_b, dtype=float)
+    dtype = np.dtype(dtype)
+    xp = get_array_module(rho_b)
+    rho_b = xp.asarray(rho_b, dtype=dtype)
 
     if mode == "normalized":
-        # Reference density to make E_local(0) ~ E0 (activates kernel for template usage)
-        if rho_ref is None:
-            rho_ref = float(rho_b[0]) if rho_b[0] != 0 else 1.0
-        rho_ref = float(rho_ref) if rho_ref != 0 else 1.0
-        return params.E0_erg * (rho_b / rho_ref)
+        # E0 / rho_ref collapsed to one scalar so the array sees a single multiply
+        return xp.multiply(rho_b, _normalized_scale(rho_b, params, rho_ref))
 
     if mode == "physical":
-        # Dimensionally consistent: energy density (rho c^2) times a coherence volume
-        V_coh = float(Lcoh_cm) ** 3
-        return rho_b * (C_LIGHT ** 2) * V_coh
+        if dtype != np.float64:
+            raise ValueError("physical mode requires dtype=float64 (c^2 * V_coh overflows narrower types)")
+        # Dimensionally consistent: energy density (rho c^2) times a coherence volume,
+        # folded into one scalar coefficient c^2 * V_coh
+        coef = _C2 * float(Lcoh_cm) ** 3
+        return xp.multiply(rho_b, dtype.type(coef))
 
     raise ValueError("mode must be one of: 'normalized', 'physical'")
 
@@ -128,33 +194,60 @@ def rho_prob(
     rho_ref: float | None = None,
     Lcoh_cm: float = 1.0e18,
     debug: bool = False,
+    dtype=np.float64,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Probabilistic density proxy for warm-core prediction.
 
+    Evaluated over the whole 1-D profile at once: E_local, Γ(E) and the
+    scaling are applied elementwise with no per-radius Python work. Stacks
+    of profiles need an explicit scalar rho_ref in normalized mode.
+
     r_kpc is unused in the local mapping (kept for future extensions).
+    dtype selects the working precision (see compute_E_local). If out is
+    given (C-contiguous, shape of rho_b, matching dtype, not sharing memory
+    with rho_b), Γ(E) and rho_prob are written into it instead of new arrays.
     """
-    E_local = compute_E_local(rho_b, params, mode=mode, rho_ref=rho_ref, Lcoh_cm=Lcoh_cm)
+    if out is not None and get_array_module(out).shares_memory(out, rho_b):
+        raise ValueError("out must not share memory with rho_b")
+
+    E_local = compute_E_local(
+        rho_b, params, mode=mode, rho_ref=rho_ref, Lcoh_cm=Lcoh_cm, dtype=dtype
+    )
 
     # Bell-curve decoherence kernel Γ(E) (canonical implementation)
-    Gamma = gamma_bell_curve(E_local, kappaA=params.kappaA, E0_local=params.E0_erg)
+    Gamma = gamma_bell_curve(
+        E_local, kappaA=params.kappaA, E0_local=params.E0_erg, dtype=dtype, out=out
+    )
+    if debug:
+        # Read before rho_prob overwrites a shared out buffer
+        gamma_max = Gamma.max()
 
-    rho_p = Gamma * params.f_ent * (1.0 + params.a_cp)
+    # f_ent * (1 + A_CP) folded into one scalar in the working dtype: one ufunc pass
+    scale = np.dtype(dtype).type(params.f_ent * (1.0 + params.a_cp))
+    xp = get_array_module(Gamma)
+    rho_p = xp.multiply(Gamma, scale, out=out)
 
     if debug:
-        safe_rho_b = np.maximum(rho_b, 1e-300)
+        # One ratio buffer serves both extrema; the rho_prob/rho_b ratio is
+        # written into safe_rho_b (a fresh array) instead of a new temporary.
+        elo_ratio = E_local * (1.0 / params.E0_erg)
+        # Floor evaluated in float64: 1e-300 underflows to 0 in float32
+        safe_rho_b = xp.maximum(rho_b, 1e-300, dtype=np.float64)
+        ratio_max = xp.divide(rho_p, safe_rho_b, out=safe_rho_b).max()
         print("---- Diagnostics ----")
         print(f"mode                 : {mode}")
         if mode.lower() == "normalized":
-            ref_used = float(rho_b[0]) if rho_ref is None else float(rho_ref)
-            print(f"rho_ref              : {ref_used:.6e} (same units as rho_b)")
+            ref_used = _resolve_rho_ref(xp.asarray(rho_b, dtype=dtype), rho_ref)
+            print(f"rho_ref              : {float(ref_used):.6e} (same units as rho_b)")
         else:
             print(f"Lcoh_cm              : {float(Lcoh_cm):.6e} cm")
             print(f"V_coh                : {(float(Lcoh_cm)**3):.6e} cm^3")
-        print(f"max(E_local/E0)       : {np.max(E_local / params.E0_erg):.6e}")
-        print(f"min(E_local/E0)       : {np.min(E_local / params.E0_erg):.6e}")
-        print(f"max(Gamma)            : {np.max(Gamma):.6e}")
-        print(f"max(rho_prob/rho_b)   : {np.max(rho_p / safe_rho_b):.6e}")
+        print(f"max(E_local/E0)       : {float(elo_ratio.max()):.6e}")
+        print(f"min(E_local/E0)       : {float(elo_ratio.min()):.6e}")
+        print(f"max(Gamma)            : {float(gamma_max):.6e}")
+        print(f"max(rho_prob/rho_b)   : {float(ratio_max):.6e}")
         print("---------------------")
 
     return rho_p
@@ -163,6 +256,12 @@ def rho_prob(
 # -----------------------------
 # Effective density and diagnostics
 # -----------------------------
+# Profiles shorter than this take the fused numba kernel; on longer ones the
+# NumPy chain wins, since its SIMD exp beats the kernel's scalar exp (measured
+# crossover 1.5-2k elements on one core, float32 and float64).
+_FUSED_MAX_SIZE = 2048
+
+
 def rho_effective(
     r_kpc: np.ndarray,
     rho_b: np.ndarray,
@@ -172,8 +271,49 @@ def rho_effective(
     rho_ref: float | None = None,
     Lcoh_cm: float = 1.0e18,
     debug: bool = False,
+    dtype=np.float64,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
-    return rho_b + rho_prob(
+    """
+    Effective density rho_eff = rho_b + rho_prob, computed in ``dtype``.
+
+    The result is written into out (C-contiguous, shape of rho_b, matching
+    dtype, not sharing memory with rho_b) when given, otherwise into one
+    newly allocated buffer; rho_prob and the sum reuse that buffer.
+
+    In normalized mode (without debug output) this dispatches to a fused
+    kernel, avoiding the E_local, Γ(E) and rho_prob intermediates: the CUDA
+    kernel for CuPy input, or the numba kernel when numba is installed and
+    rho_b has fewer than _FUSED_MAX_SIZE elements.
+    """
+    xp = get_array_module(rho_b)
+    rho_b = xp.asarray(rho_b, dtype=dtype)
+    if out is None:
+        out = xp.empty_like(rho_b, order="C")
+    elif out.shape != rho_b.shape or out.dtype != rho_b.dtype or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous array with the shape of rho_b and the given dtype")
+    elif xp.shares_memory(out, rho_b):
+        # rho_prob writes Γ(E) into out before rho_b is added back
+        raise ValueError("out must not share memory with rho_b")
+
+    if xp is not np:
+        fused = rho_eff_cuda
+    else:
+        fused = rho_eff_fused if rho_b.size < _FUSED_MAX_SIZE else None
+    if fused is not None and not debug and mode.lower().strip() == "normalized":
+        scale = _normalized_scale(rho_b, params, rho_ref)[()]
+        fused(
+            xp.ascontiguousarray(rho_b).reshape(-1),
+            params.E0_erg,
+            params.kappaA,
+            params.f_ent,
+            params.a_cp,
+            scale,
+            out.reshape(-1),
+        )
+        return out
+
+    rho_prob(
         r_kpc,
         rho_b,
         params,
@@ -181,20 +321,35 @@ def rho_effective(
         rho_ref=rho_ref,
         Lcoh_cm=Lcoh_cm,
         debug=debug,
+        dtype=dtype,
+        out=out,
     )
+    return xp.add(out, rho_b, out=out)
 
 
 def inner_slope(r_kpc: np.ndarray, rho: np.ndarray, r_max: float = 1.0) -> float:
     """
     Estimate inner log-slope d ln(rho) / d ln(r) over (0, r_max] using a
     least-squares fit in log-log space for stability.
+
+    Uses the one-pass numba kernel when numba is installed.
     """
+    if slope_streaming is not None:
+        r_flat = np.ascontiguousarray(r_kpc).reshape(-1)
+        rho_flat = np.ascontiguousarray(rho).reshape(-1)
+        if r_flat.shape != rho_flat.shape:
+            # The kernel indexes without bounds checks
+            raise ValueError("r_kpc and rho must have the same number of elements")
+        return float(slope_streaming(r_flat, rho_flat, float(r_max)))
+
     mask = (r_kpc > 0) & (r_kpc <= r_max) & (rho > 0)
     if mask.sum() < 3:
         return np.nan
     x = np.log(r_kpc[mask])
     y = np.log(rho[mask])
-    m, _b = np.polyfit(x, y, 1)
+    # Closed-form degree-1 least squares: m = cov(x, y) / var(x)
+    dx = x - x.mean()
+    m = (dx * (y - y.mean())).sum() / (dx * dx).sum()
     return float(m)
 
 
@@ -241,7 +396,7 @@ def main():
     args = parser.parse_args()
 
     params = GoPParams()
-    r = np.logspace(-2, 1.8, 400)  # 0.01 → 63 kpc
+    r = _radial_grid(*_R_GRID_DEFAULT)  # 0.01 → 63 kpc
 
     # Print canonical parameters (credibility + reproducibility)
     print("Core-four parameters (imported from gop_curvature.gop_constants):")
@@ -259,7 +414,7 @@ def main():
         print(f"  Lcoh_cm = {args.Lcoh_cm:.3e} cm")
     print()
 
-    rho_b = rho_baryon(r, rho0=args.rho0, r_core_kpc=args.rcore_kpc)
+    rho_b = _rho_baryon_on_grid(*_R_GRID_DEFAULT, args.rho0, args.rcore_kpc)
     rho_eff = rho_effective(
         r,
         rho_b,
@@ -268,6 +423,8 @@ def main():
         rho_ref=args.rho_ref,
         Lcoh_cm=args.Lcoh_cm,
         debug=args.debug,
+        # Template mode only feeds a log-log plot: float32 halves memory traffic
+        dtype=np.float32 if args.mode == "normalized" else np.float64,
     )
 
     slope_b = inner_slope(r, rho_b)